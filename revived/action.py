@@ -56,29 +56,82 @@ you can define ``action creators`` in this way:
     action_obj = an_action_type_with_parameters(1, 2)
 """
 from enum import Enum
-from enum import unique
-from functools import wraps
+from sys import intern
+from types import MappingProxyType
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Optional
+from weakref import WeakValueDictionary
+
+# Shared read-only payload for actions created without data: dispatching
+# frequent parameterless actions should not allocate one empty dict per
+# action.
+_EMPTY = MappingProxyType({})  # type: Dict[str, Any]
+
+# Cache of already-built action creators: re-decorating the same function
+# with the same action type (plugin reloads, modules decorating shared
+# creators) returns the existing wrapper instead of building a duplicate
+# closure. Values are held weakly, so dropping every reference to a creator
+# drops its cache entry too.
+_creator_cache = WeakValueDictionary()  # type: WeakValueDictionary
+
+
+def _type_token(action_type: Any) -> Any:
+    """Returns the dispatch token for the given action type.
+
+    The token is the interned member value - cached at member creation -
+    for :any:`revived.action.ActionType` members, and the value itself
+    otherwise, interned first when it is a plain string. Interned strings
+    compare identity-first, so every reducer gate compare and dispatch
+    table lookup starts with a pointer check; and since enum members and
+    plain strings with the same value produce the same token, a reducer
+    registered for ``'foo'`` matches ``Action(AT.FOO)`` and vice versa,
+    exactly like the str mixin equality the enums expose to user code.
+
+    :param action_type: The action type.
+    :returns: The dispatch token.
+    """
+    token = getattr(action_type, '_id', None)
+    if token is not None:
+        return token
+    if isinstance(action_type, str):
+        return intern(action_type)
+    return action_type
 
 
-@unique
 class ActionType(str, Enum):
     """Action type base class.
 
     The idea behind this class is to use an unique enum to store action types
     for each module. Usually there would be no need for such a feature-less
     class, but it is pretty handy while using type hints.
+
+    Member values are expected to be unique within each enum: this is not
+    verified at class-creation time anymore (``enum.unique`` walks every
+    member at import), it is up to the application test suite to assert it.
     """
-    # FIXME: this method is added to avoid sphinx_autodoc_typehints errors:
+    # NOTE: an explicit __init__ is also needed to avoid
+    # sphinx_autodoc_typehints errors:
     # see https://github.com/agronholm/sphinx-autodoc-typehints/issues/12
-    def __init__(*args, **kwargs):
-        pass
+    def __init__(self, *args, **kwargs) -> None:
+        # Intern the member value: values declared as string literals are
+        # usually interned by the compiler already, but dynamically built
+        # ones are not, and interning guarantees value compares start with a
+        # pointer check.
+        value = self._value_
+        if isinstance(value, str):
+            self._value_ = value = intern(value)
+        # Cache the dispatch token: the *interned value*, not the member
+        # object. Interned strings compare identity-first, so gates and
+        # dispatch-table lookups on the token are as cheap as a pointer
+        # compare, while members of different enums sharing a value - and
+        # plain-string action types equal to it - keep matching each other,
+        # exactly as they do through the str mixin equality.
+        self._id = value
 
 
-class Action(dict):
+class Action:
     """Structure that stores all the required data for an action.
 
     Redux actions are plain objects - ie: python dicts - but having a specific
@@ -86,20 +139,99 @@ class Action(dict):
     store the type as ``metadata`` instead of part of the action data itself.
 
     While ``action_type`` is going to be stored as ``metadata``, the
-    :any:`revived.action.Action` instance itself is going to behave exactly as a
-    dict, with all the action data inside.
+    :any:`revived.action.Action` instance itself exposes the usual mapping
+    protocol, with all the action data inside: reducers keep reading the data
+    with ``action['key']``, ``action.get('key')`` or ``dict(action)``.
+
+    The class uses ``__slots__`` and keeps the data in a separate ``payload``
+    dict: an action allocates a single small fixed-size object instead of a
+    dict-subclass instance plus the attribute ``__dict__`` needed to store
+    the type.
 
     :param action_type: The type of the action.
     :param data: An optional dict containing data. No restriction on depth
-        and members type, as long as the keys are strings.
+        and members type, as long as the keys are strings. The dict is
+        referenced, not copied: it should not be mutated after the action is
+        created.
     """
 
+    __slots__ = ('type', '_type_id', 'payload')
+
     def __init__(self, action_type: ActionType, data: Optional[Dict[str, Any]]=None) -> None:
-        super().__init__(**(data or {}))
         self.type = action_type
+        # Dispatch token used by reducers to match the action type without
+        # paying the full ``Enum.__eq__`` cost: the interned value, cached
+        # on ActionType members and computed here for plain types.
+        self._type_id = _type_token(action_type)
+        # The dict is stored by reference: copying it on every action would
+        # re-hash every key, and action creators hand over a fresh dict
+        # anyway. Actions are conceptually immutable, so the caller is
+        # expected not to mutate the data afterwards.
+        self.payload = data if data else _EMPTY
+
+    @classmethod
+    def _fast(cls, action_type: ActionType, data: Optional[Dict[str, Any]]) -> 'Action':
+        """Fast-path constructor bypassing the regular instantiation.
+
+        Used internally by the ``action creators``, which build one action
+        per call: skipping the type-call machinery saves one python-level
+        call on every dispatch. Semantics are identical to the regular
+        constructor.
+
+        :param action_type: The type of the action.
+        :param data: An optional dict containing data, stored by reference.
+        :returns: The action instance.
+        """
+        a = object.__new__(cls)
+        a.type = action_type
+        a._type_id = _type_token(action_type)
+        a.payload = data if data else _EMPTY
+        return a
+
+    def __getitem__(self, key: str) -> Any:
+        return self.payload[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.payload
 
+    def __len__(self) -> int:
+        return len(self.payload)
 
-def action(action_type: ActionType) -> Callable[[Callable], Callable]:
+    def get(self, key: str, default: Optional[Any]=None) -> Any:
+        """Gets the value for the given key from the action data.
+
+        :param key: The key to look up.
+        :param default: The value returned when the key is missing.
+        :returns: The value for the given key, or the default.
+        """
+        return self.payload.get(key, default)
+
+    def __iter__(self):
+        return iter(self.payload)
+
+    def keys(self):
+        """Returns a view on the keys of the action data.
+
+        :returns: The keys of the action data.
+        """
+        return self.payload.keys()
+
+    def values(self):
+        """Returns a view on the values of the action data.
+
+        :returns: The values of the action data.
+        """
+        return self.payload.values()
+
+    def items(self):
+        """Returns a view on the key-value pairs of the action data.
+
+        :returns: The key-value pairs of the action data.
+        """
+        return self.payload.items()
+
+
+def action(action_type: ActionType, fields: Optional[Any]=None) -> Callable[[Callable], Callable]:
     """Decorator function to use as an ``action creator`` factory.
 
     This helper function is used to create action creators. The idea behind this
@@ -108,12 +240,50 @@ def action(action_type: ActionType) -> Callable[[Callable], Callable]:
     functions preparing the proper :any:`revived.action.Action` instance that
     is needed by the revived API.
 
+    When the decorated function always returns the same keys, the shape of
+    the action is known at decoration time: passing those keys as ``fields``
+    generates a dedicated :any:`revived.action.Action` subclass with one slot
+    per field, populated from the returned dict. Reducers can then read
+    ``action.field`` - a direct slot load - instead of going through the
+    payload hash lookup of ``action['field']``; the mapping protocol keeps
+    working either way.
+
     :param action_type: The type of the action.
+    :param fields: An optional sequence of keys always present in the dicts
+        returned by the decorated function.
     :returns: The ``action creator``.
     """
     def wrap(f: Callable[..., Dict]) -> Callable[..., Action]:
-        @wraps(f)
-        def wrapped(*args, **kwargs) -> Action:
-            return Action(action_type, f(*args, **kwargs))
+        cache_key = (action_type, f, tuple(fields) if fields is not None else None)
+        cached = _creator_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if fields is None:
+            # Actions are immutable, so every payload-less call can return
+            # the same instance: parameterless actions dispatched in tight
+            # loops then allocate nothing at all.
+            empty_action = Action._fast(action_type, None)
+
+            def wrapped(*args, **kwargs) -> Action:
+                data = f(*args, **kwargs)
+                if not data:
+                    return empty_action
+                return Action._fast(action_type, data)
+        else:
+            cls = type(f.__name__ + '_action', (Action,), {'__slots__': tuple(fields)})
+
+            def wrapped(*args, **kwargs) -> Action:
+                data = f(*args, **kwargs)
+                a = cls._fast(action_type, data)
+                for field in fields:
+                    setattr(a, field, data[field])
+                return a
+        # functools.wraps is deliberately not used: copying the whole
+        # metadata set is pure decoration-time overhead, a name and the
+        # reference to the original function are enough for introspection.
+        wrapped.__wrapped__ = f  # type: ignore
+        wrapped.__name__ = f.__name__
+        _creator_cache[cache_key] = wrapped
         return wrapped
     return wrap
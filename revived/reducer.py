@@ -165,17 +165,29 @@ has exactly the same result of:
 And of course **you can combine** a ``reducer module`` with other ``reducers``
 and ``reducer modules``.
 """
+from .action import _type_token
 from .action import Action
 from .action import ActionType
-from functools import wraps
+from sys import intern
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Union
 
 Reducer = Callable[[Any, Action], Any]
 ReducerList = List[Reducer]
 
+# Shared default for dispatch-table misses: a no-op dispatch is a single dict
+# lookup plus an iteration that terminates immediately, with no allocation.
+_EMPTY_TUPLE = ()  # type: Any
+
+# Cache of compiled dispatcher code objects, keyed by generated source. The
+# source only encodes the *shape* of a combined reducer (the concrete
+# reducers, types and keys are bound as defaults), so combining the same
+# shape repeatedly reuses the compiled code and skips the compile step.
+_code_cache = {}  # type: Dict[str, Any]
+
 
 class Module:
     """Helper class for module creations.
@@ -186,8 +198,14 @@ class Module:
     will call all the registered reducers. The call order is not guaranteed.
     """
 
+    __slots__ = ('_by_type', '_frozen')
+
     def __init__(self) -> None:
-        self._reducers = []  # type: ReducerList
+        # Maps each action type id to the tuple of raw reducer functions
+        # registered for it. Tuples - not lists - are stored: registration is
+        # rare and dispatch-time iteration of a tuple is cheaper.
+        self._by_type = {}  # type: Dict[Any, Any]
+        self._frozen = None  # type: Any
 
     def __call__(self, prev: Any, action: Action):
         """Lets the module work like a reducer.
@@ -196,53 +214,304 @@ class Module:
         :param action: The action performed.
         :returns: The next state.
         """
-        next = prev
-        for r in self._reducers:
-            next = r(next, action)
-        return next
+        frozen = self._frozen
+        if frozen is not None:
+            return frozen(prev, action)
+        for r in self._by_type.get(action._type_id, _EMPTY_TUPLE):
+            prev = r(prev, action)
+        return prev
 
-    def reducer(self, action_type: ActionType) -> Callable[[Reducer], Reducer]:
-        """Decorator function to create a reducer.
+    @property
+    def action_types(self) -> Any:
+        """The set of action types currently handled by the module.
+
+        Used by :any:`revived.reducer.combine_reducers` and by the store to
+        skip the module for actions it would ignore anyway.
+
+        :returns: The frozenset of handled action type ids.
+        """
+        return frozenset(self._by_type)
+
+    def freeze(self) -> Reducer:
+        """Compiles a specialized dispatcher for the registered reducers.
 
-        Creates a reducer attached to the module. This reducer is handling the
-        specified action type and it is going to be ignored in case the action
-        is of a different type.
+        Most applications finish registering reducers at import time and
+        never mutate the module afterwards: freezing compiles a straight-line
+        dispatch function for the current reducer set (see
+        :any:`revived.reducer.combine_reducers`, which applies the same
+        specialization at factory time) and routes subsequent calls through
+        it. The compiled function is also returned, so it can be used
+        directly as a reducer without even the delegation step.
 
-        :param action_type: The action type.
+        Registering a new reducer after a freeze simply invalidates the
+        compiled dispatcher: the module falls back to the generic dispatch
+        until :any:`revived.reducer.Module.freeze` is called again.
+
+        :returns: The compiled reducer function.
+        """
+        entries = [
+            (None, (t,), f)
+            for t, fs in self._by_type.items()
+            for f in fs
+        ]  # type: List[Any]
+        self._frozen = _compile_reduce(entries)
+        return self._frozen
+
+    def reducer(self, *action_types: ActionType, jit: bool=False) -> Callable[[Reducer], Reducer]:
+        """Decorator function to create a reducer.
+
+        Creates a reducer attached to the module. This reducer is handling
+        the specified action types - usually just one - and it is going to be
+        ignored in case the action is of a different type.
+
+        Registration should be completed before the module is passed to
+        :any:`revived.reducer.combine_reducers` or to the store: both
+        capture the set of handled action types when they are built, so a
+        reducer registered afterwards is only seen by direct calls to the
+        module itself.
+
+        :param action_types: The handled action types.
+        :param jit: Whether to compile the reducer with numba, when it is
+            installed. Meant for reducers doing numeric work on numpy-typed
+            state. Jitted reducers receive *only* the previous state -
+            numba cannot type the action object - so the decorated function
+            must take a single parameter.
         :returns: The reducer function.
         """
+        at_ids = tuple(_type_token(t) for t in action_types)
+
         def wrap(f: Reducer) -> Reducer:
-            @wraps(f)
-            def wrapped(prev: Any, action: Action) -> Reducer:
-                next = prev
-                if action.type == action_type:
-                    next = f(prev, action)
-                return next
-            self._reducers.append(wrapped)
-            return wrapped
+            f = _maybe_jit(f, jit)
+            # The raw function is registered: the per-reducer type check is
+            # already done - once - by the dispatch table lookup in __call__,
+            # so gating the registered entry would only add a useless python
+            # frame on the module's hot path. The *returned* function is
+            # gated exactly like the standalone decorator's though, so
+            # calling it directly - or combining it elsewhere - keeps the
+            # documented "ignored for other types" semantics.
+            for at_id in at_ids:
+                self._by_type[at_id] = self._by_type.get(at_id, ()) + (f,)
+            self._frozen = None
+            return _gate(f, at_ids)
         return wrap
 
 
-def reducer(action_type: ActionType) -> Callable[[Reducer], Reducer]:
+def reducer(*action_types: ActionType, jit: bool=False) -> Callable[[Reducer], Reducer]:
     """Decorator function to create a reducer.
 
-    Creates a reducer. This reducer is handling the specified action type and it
-    is going to be ignored in case the action is of a different type.
+    Creates a reducer. This reducer is handling the specified action types -
+    usually just one - and it is going to be ignored in case the action is of
+    a different type.
 
-    :param action_type: The action type. :returns: The reducer function.
+    :param action_types: The handled action types.
+    :param jit: Whether to compile the reducer with numba, when it is
+        installed. Meant for reducers doing numeric work on numpy-typed
+        state. Jitted reducers receive *only* the previous state - numba
+        cannot type the action object - so the decorated function must take
+        a single parameter.
     :returns: The reducer function.
     """
+    at_ids = tuple(_type_token(t) for t in action_types)
+
     def wrap(f: Reducer) -> Reducer:
-        @wraps(f)
-        def wrapped(prev: Any, action: Action) -> Reducer:
-            next = prev
-            if action.type == action_type:
-                next = f(prev, action)
-            return next
-        return wrapped
+        return _gate(_maybe_jit(f, jit), at_ids)
     return wrap
 
 
+def _gate(f: Reducer, at_ids: tuple) -> Reducer:
+    """Returns a type-gated wrapper around the given reducer.
+
+    The wrapper calls the reducer only for actions whose dispatch token is
+    in ``at_ids`` and returns the previous state unchanged otherwise. Both
+    reducer decorators return it, so a decorated reducer keeps the
+    documented "ignored for other types" semantics wherever it is called
+    from.
+
+    :param f: The reducer function.
+    :param at_ids: The tuple of handled dispatch tokens.
+    :returns: The gated reducer.
+    """
+    if len(at_ids) == 1:
+        at_id = at_ids[0]
+
+        def wrapped(prev: Any, action: Action) -> Reducer:
+            if action._type_id == at_id:
+                return f(prev, action)
+            return prev
+    else:
+        ids = frozenset(at_ids)
+
+        def wrapped(prev: Any, action: Action) -> Reducer:
+            if action._type_id in ids:
+                return f(prev, action)
+            return prev
+    # functools.wraps is deliberately not used here: the wrapper sits on
+    # the dispatch hot path and only needs the reference to the original
+    # function for introspection and for combine_reducers to unwrap it.
+    wrapped.__wrapped__ = f  # type: ignore
+    wrapped.__name__ = f.__name__
+    # Expose the handled types so that combine_reducers can register the
+    # wrapped function into its dispatch table and skip the wrapper (and
+    # its type check) entirely, and so the store can skip the reducer for
+    # unhandled actions when it is used as root reducer directly.
+    wrapped._action_types = at_ids
+    wrapped.action_types = frozenset(at_ids)
+    return wrapped
+
+
+def _maybe_jit(f: Callable[[Any], Any], jit: bool) -> Any:
+    """Optionally compiles the given state-only reducer with numba.
+
+    Jitted reducers use a reduced calling convention: they receive *only*
+    the previous state, because nopython mode cannot type an arbitrary
+    python object like the action - not even an unused one. The returned
+    wrapper adapts the ``(prev, action)`` reducer signature by dropping the
+    action, with or without numba, so the semantics do not depend on the
+    environment.
+
+    numba is *not* a dependency of revived: when it is not installed the
+    plain python function is called through the same state-only convention,
+    so ``jit=True`` is a hint rather than a requirement. Only reducers doing
+    numeric work on numpy-typed state benefit from the compilation;
+    dict-returning reducers should leave it off.
+
+    :param f: The state-only reducer function.
+    :param jit: Whether the reducer should be compiled.
+    :returns: The adapted - and possibly compiled - reducer, or the function
+        itself when ``jit`` is false.
+    """
+    if not jit:
+        return f
+    try:
+        from numba import njit  # type: ignore
+    except ImportError:
+        compiled = f
+    else:
+        compiled = njit(cache=True)(f)
+
+    def run(prev: Any, action: Action) -> Any:
+        return compiled(prev)
+    run.__name__ = f.__name__
+    return run
+
+
+def _handled_types(r: Any) -> Any:
+    """Returns the action types handled by the given reducer, if known.
+
+    Looks for the metadata attached by the reducer decorator first, then for
+    the ``action_types`` set exposed by modules and fully-typed combined
+    reducers. Returns ``None`` for reducers whose handled types are unknown
+    - those must always run.
+
+    :param r: The reducer to inspect.
+    :returns: The handled action types, or ``None`` when unknown.
+    """
+    types = getattr(r, '_action_types', None)
+    if types is not None:
+        return types
+    # An empty set means "no reducer registered yet": treat it as unknown so
+    # the reducer keeps being invoked, in case it is mutated later.
+    return getattr(r, 'action_types', None) or None
+
+
+def _compile_reduce(entries: List[Any]) -> Reducer:
+    """Compiles a specialized reducer for the given dispatch entries.
+
+    The structure of a combined reducer is fully known at factory time, so
+    instead of looping over the registered reducers on every dispatch a
+    straight-line function is generated, compiled once and returned: one call
+    per reducer, gated inline on the action type for the reducers that
+    declare the types they handle. The referenced reducers and type tokens
+    are bound as default arguments, making every access a local variable
+    load.
+
+    :param entries: A list of ``(key, action_types, reducer)`` tuples in
+        registration order. ``key`` is ``None`` for top-level reducers and
+        ``action_types`` is ``None`` for reducers that must always run.
+    :returns: The compiled reducer function.
+    """
+    ns = {}  # type: Dict[str, Any]
+    lines = []
+    handled = set()  # type: Any
+    all_typed = True
+    has_keys = False
+
+    for i, (key, types, f) in enumerate(entries):
+        ns['_f{}'.format(i)] = f
+
+        gate = None
+        if types is None:
+            all_typed = False
+        else:
+            types = tuple(types)
+            handled.update(types)
+            if len(types) == 1:
+                ns['_t{}'.format(i)] = types[0]
+                gate = '_t == _t{}'.format(i)
+            else:
+                ns['_t{}'.format(i)] = frozenset(types)
+                gate = '_t in _t{}'.format(i)
+
+        if key is None:
+            call = ['prev = _f{}(prev, action)'.format(i)]
+        else:
+            ns['_k{}'.format(i)] = key
+            has_keys = True
+            # Subscript plus try/except instead of dict.get: the happy path
+            # (key present) costs a single hash lookup and no method call,
+            # and the exception setup is free in CPython when nothing is
+            # raised. The enclosing dict is copied - once - only when a
+            # subtree actually changed: when every subtree reducer returns
+            # its input unchanged the previous state object is returned
+            # as-is, so a dispatch that changes nothing allocates nothing
+            # and callers can detect the no-op with an ``is`` check.
+            call = [
+                'try:',
+                '    _cur = prev[_k{}]'.format(i),
+                'except KeyError:',
+                '    _cur = None',
+                '_nxt = _f{}(_cur, action)'.format(i),
+                'if _nxt is not _cur:',
+                '    if not _copied:',
+                '        prev = dict(prev)',
+                '        _copied = True',
+                '    prev[_k{}] = _nxt'.format(i),
+            ]
+
+        if gate is None:
+            lines.extend('    {}'.format(c) for c in call)
+        else:
+            lines.append('    if {}:'.format(gate))
+            lines.extend('        {}'.format(c) for c in call)
+
+    if has_keys:
+        lines.insert(0, '    _copied = False')
+
+    if any('_t ' in line for line in lines):
+        # Hoist the action type token into a local once: the gates become
+        # plain local-variable compares instead of re-reading the attribute
+        # for every gated reducer.
+        lines.insert(0, '    _t = action._type_id')
+
+    params = ''.join(', {0}={0}'.format(name) for name in ns)
+    src = 'def reduce(prev, action{}):\n{}\n    return prev\n'.format(
+        params, '\n'.join(lines))
+
+    code = _code_cache.get(src)
+    if code is None:
+        code = compile(src, '<combine_reducers>', 'exec')
+        _code_cache[src] = code
+    exec(code, ns)
+    reduce = ns['reduce']
+    reduce.__doc__ = 'Combined reducer specialized for its reducer set.'
+    if all_typed:
+        # Every combined reducer declares the types it handles: expose the
+        # union so enclosing combiners and the store can skip this reducer
+        # for actions it would ignore anyway.
+        reduce.action_types = frozenset(handled)
+    return reduce
+
+
 def combine_reducers(*top_reducers: Union[Reducer, Module], **reducers: Union[Reducer, Module]) -> Reducer:
     """Create a reducer combining the reducers passed as parameters.
 
@@ -251,16 +520,34 @@ def combine_reducers(*top_reducers: Union[Reducer, Module], **reducers: Union[Re
     so it is possible to combine the resulted function with other reducers
     creating at-will complex reducer trees.
 
+    The combined reducer is specialized for the reducers - and the handled
+    action types - known at this point: reducers registered into a module
+    *after* it has been combined are not picked up. Finish registering, then
+    combine.
+
     :param top_reducers: An optional list of top-level reducers.
     :param reducers: An optional list of reducers that will handle a subpath.
     :returns: The combined reducer function.
     """
-    def reduce(prev: Any, action: Action) -> Any:
-        next = prev
-        for r in top_reducers:
-            next = r(next, action)
-        for key, r in reducers.items():
-            next[key] = r(next.get(key), action)
-        return next
-
-    return reduce
+    # Collect the reducers at factory time, in registration order. Reducers
+    # that declare the action types they handle (via the reducer decorator)
+    # are registered unwrapped together with their types, so the generated
+    # dispatcher can gate them inline; reducers without type metadata
+    # (modules, nested combined reducers, plain functions) are always
+    # invoked, exactly as before.
+    entries = []  # type: List[Any]
+
+    for r in top_reducers:
+        types = _handled_types(r)
+        f = getattr(r, '__wrapped__', r) if types is not None else r
+        entries.append((None, types, f))
+
+    for key, r in reducers.items():
+        # Interning the subtree keys makes the per-dispatch get/setitem hash
+        # lookups start with a pointer compare on the key.
+        key = intern(key)
+        types = _handled_types(r)
+        f = getattr(r, '__wrapped__', r) if types is not None else r
+        entries.append((key, types, f))
+
+    return _compile_reduce(entries)
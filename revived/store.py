@@ -83,17 +83,62 @@ Subscribe using :any:`revived.store.Store.subscriber`
 
     # unsubscribe the function
     a_subscriber.unsubscribe()
+
+Cheap change detection in subscribers
+=====================================
+
+Reducers written in the redux style never mutate their input: they either
+return the previous state unchanged or build a new enclosing dict, sharing
+the references to the untouched subtrees. The store itself relies on this
+convention: a dispatch whose root reducer returns the previous state object
+unchanged does not notify subscribers at all. Subscribers reading a few
+paths out of a deep state can apply the same idea and detect changes by
+identity - comparing a subtree with the previously seen one using ``is`` -
+without any deep equality walk:
+
+.. code:: python
+
+    last_seen = None
+
+    @store.subscriber
+    def on_change():
+        nonlocal last_seen
+        subtree = store.get_state()['some_subtree']
+        if subtree is last_seen:
+            return
+        last_seen = subtree
+        # do something with the changed subtree!
+
+:any:`revived.store.Store.get_state` returns the state object itself, with
+no wrapper or defensive copy: the returned object **must be treated as
+read-only**.
+
+Thread safety
+=============
+
+The store is deliberately lock-free: dispatching is expected to happen from
+a single thread (typically the main/update loop), and on that thread every
+dispatch runs to completion - reduce, then notify - before the next one
+starts, which is what makes the reentrancy check and the ``is``-based
+change detection sound. Threads other than the dispatching one may safely
+*read* the state through :any:`revived.store.Store.get_state`: reducers
+never mutate state in place, so a reader always sees a complete -- possibly
+slightly stale -- state object. Dispatching or subscribing concurrently
+from multiple threads is not supported; serialize those through a queue
+drained by the dispatching thread instead.
 """
+from .action import _type_token
 from .action import action
 from .action import Action
 from .action import ActionType as BaseActionType
 from .reducer import Module
 from .reducer import Reducer
+from functools import partial
 from typing import Any
 from typing import Callable
+from typing import Iterable
+from typing import Optional
 from typing import Union
-import copy
-import uuid
 
 
 class ActionType(BaseActionType):
@@ -113,9 +158,17 @@ def init():
     pass
 
 
+# The init action is stateless (no payload): build it once at import and let
+# every store constructor reuse it instead of re-running the action creator
+# and allocating a new Action per store.
+_INIT_ACTION = init()
+
+
 class DispatchInReducerError(Exception):
     """Raised when :any:`revived.store.Store.dispatch` is called in a reducer.
     """
+
+    __slots__ = ()
     # FIXME: this method is added to avoid sphinx_autodoc_typehints errors:
     # see https://github.com/agronholm/sphinx-autodoc-typehints/issues/12
     def __init__(self, *args, **kwargs):
@@ -123,7 +176,7 @@ class DispatchInReducerError(Exception):
 
 
 class Subscriber:
-    """Wrapper around a subscriber function with the ``unsubscribe`` property.
+    """Wrapper around a subscriber function with the ``unsubscribe`` attribute.
 
     While creating a subscriber using the decorator it is not possible to return
     the ``unsubscribe`` function. So a :any:`revived.store.Subscriber` is
@@ -131,27 +184,25 @@ class Subscriber:
     :any:`revived.store.Subscriber.unsubscribe` function to be used to properly
     unregister the subscriber.
 
+    ``unsubscribe`` is a plain attribute: it never changes after
+    construction, and a property would add a descriptor call to every
+    access.
+
     :param callback: The callback to be wrapped into the subscriber.
     :param unsubscribe: The unsubscribe function for the subscriber.
     """
 
+    __slots__ = ('callback', 'unsubscribe')
+
     def __init__(self, callback: Callable[[], None], unsubscribe: Callable[[], None]) -> None:
         self.callback = callback
-        self._unsubscribe = unsubscribe
+        self.unsubscribe = unsubscribe
 
     def __call__(self) -> None:
         """Calls the wrapped subscriber.
         """
         self.callback()
 
-    @property
-    def unsubscribe(self) -> Callable[[], None]:
-        """Property containing the ``unsubscribe`` function.
-
-        :returns: The ``unsubscribe`` function for the subscriber.
-        """
-        return self._unsubscribe
-
 
 class Store:
     """Container object for the global state.
@@ -169,19 +220,84 @@ class Store:
     to add subscribers later, while there is no way - *at the moment* - to
     replace the reducer.
 
+    The store captures the set of action types handled by the root reducer
+    at construction time, and skips the reducer tree entirely for actions
+    outside of it: reducer registration (e.g. on a
+    :any:`revived.reducer.Module`) must therefore be completed before the
+    store is built - reducers registered afterwards are silently ignored.
+
     :param reducer: The root reducer.
+    :param on_error: An optional handler called as ``on_error(exception,
+        callback)`` when a subscriber raises. When it is not given, the first
+        subscriber exception is re-raised after every subscriber has been
+        notified; in both cases one failing subscriber does not prevent the
+        others from running.
     """
 
-    def __init__(self, reducer: Union[Reducer, Module]) -> None:
+    # With __slots__ every attribute lives at a fixed offset, so the
+    # PEP 412 key-sharing concerns of dict-backed instances do not apply.
+    # Keep __init__ assigning the attributes in this same order anyway, and
+    # never set attributes on Store instances outside __init__.
+    __slots__ = (
+        '_reducer',
+        '_handled',
+        '_state',
+        '_subs',
+        '_subs_snapshot',
+        '_subs_by_type',
+        '_subs_dirty',
+        '_next_key',
+        '_is_reducing',
+        '_batch_depth',
+        '_dirty',
+        '_batch_types',
+        '_on_error',
+    )
+
+    def __init__(self, reducer: Union[Reducer, Module], on_error: Optional[Callable[[Exception, Callable[[], None]], None]]=None) -> None:
         self._reducer = reducer
+        # Action types handled by the root reducer, when it exposes them
+        # (modules and fully-typed combined reducers do): dispatching an
+        # action no reducer handles then skips the reducer tree entirely.
+        # Reducer registration must be completed before the store is built.
+        # An *empty* set means "no reducer registered yet": treat it as
+        # unknown - the same normalization _handled_types() applies - so a
+        # store built over a still-empty module keeps invoking it instead of
+        # dropping every dispatch forever.
+        self._handled = getattr(reducer, 'action_types', None) or None
         self._state = None  # type: Any
 
-        self._subscribers = {}  # type: dict[uuid.UUID, Callable[[], None]]
+        self._subs = {}  # type: dict[int, tuple]
+        # Immutable snapshots of the subscriber callbacks: dispatch iterates
+        # the snapshots directly instead of copying the subscriber dict on
+        # every call, which is safe because mutations swap in fresh tuples
+        # and never touch the ones an in-flight dispatch is iterating. The
+        # rebuild is lazy: subscribe/unsubscribe just flip the dirty flag, so
+        # bursts of subscription changes (typical at startup) cost O(1) each
+        # and the O(N) rebuild is paid once at the next dispatch. Publishing
+        # the fresh tuples is a pair of attribute stores - each atomic under
+        # the GIL - so no compare-and-swap retry loop is needed: an in-flight
+        # notification keeps iterating the tuple it captured, later
+        # dispatches pick up the new one. ``_subs_snapshot`` holds the
+        # subscribers interested in every action; ``_subs_by_type`` indexes
+        # the ones that asked only for specific action types, so they are
+        # skipped entirely on dispatches of types they do not care about.
+        self._subs_snapshot = ()  # type: tuple
+        self._subs_by_type = {}  # type: dict
+        self._subs_dirty = False
+        self._next_key = 0
         self._is_reducing = False
+        self._batch_depth = 0
+        self._dirty = False
+        # Dispatch tokens of the state-changing actions seen inside the
+        # current batch, used to pick the interested type-filtered
+        # subscribers when the batch notification fires.
+        self._batch_types = set()  # type: set
+        self._on_error = on_error
 
-        self.dispatch(init())
+        self.dispatch(_INIT_ACTION)
 
-    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+    def subscribe(self, callback: Callable[[], None], types: Optional[Iterable[Any]]=None) -> Callable[[], None]:
         """Subscribes a callback to *state changes*.
 
         Every time the state changes, the callback is called. No parameters are
@@ -189,22 +305,73 @@ class Store:
         connect the store with the caller. The returned function can be called
         without arguments to unsubscribe the callback.
 
+        When ``types`` is given, the callback is only called for state
+        changes triggered by actions of those types: subscribers reacting to
+        a few action types are then skipped - without even being iterated -
+        on every other dispatch.
+
+        Delivery is synchronous, on the dispatching thread: when the
+        callback runs, :any:`revived.store.Store.get_state` already returns
+        the new state, and the dispatch that triggered the notification does
+        not return until every subscriber ran. Subscribers doing slow work
+        should hand it off (e.g. push onto a queue) rather than block the
+        dispatch path.
+
         :param callback: The callback to be subscribed.
+        :param types: An optional iterable of action types the callback is
+            interested in. When omitted the callback is called on every
+            state change.
         :returns: The unsubscribe function.
         """
-        key = uuid.uuid1()
-        self._subscribers[key] = callback
-
-        def unsubscribe() -> None:
-            self._subscribers.pop(key, None)
+        # A monotonically increasing integer is all that is needed to
+        # identify a subscription: unlike uuid1 it costs one increment, no
+        # system calls and no 128-bit object allocation.
+        self._next_key += 1
+        key = self._next_key
+        if types is not None:
+            types = frozenset(_type_token(t) for t in types)
+        self._subs[key] = (callback, types)
+        self._subs_dirty = True
+
+        # functools.partial over a bound method instead of a closure: no
+        # cell object and no python function object are allocated per
+        # subscription.
+        return partial(self._unsubscribe_key, key)
+
+    def _unsubscribe_key(self, key: int) -> None:
+        """Unsubscribes the subscription with the given key, if any.
+
+        :param key: The key of the subscription to remove.
+        """
+        self._subs.pop(key, None)
+        self._subs_dirty = True
 
-        return unsubscribe
+    def _rebuild_snapshots(self) -> None:
+        """Rebuilds the subscriber snapshots from the subscription dict.
 
-    def subscriber(self, callback: Callable[[], None]) -> Subscriber:
+        Called lazily from the notification paths when subscriptions changed
+        since the last rebuild.
+        """
+        universal = []
+        by_type = {}  # type: dict
+        for cback, types in self._subs.values():
+            if types is None:
+                universal.append(cback)
+            else:
+                for t in types:
+                    by_type.setdefault(t, []).append(cback)
+        self._subs_snapshot = tuple(universal)
+        self._subs_by_type = {t: tuple(cbs) for t, cbs in by_type.items()}
+        self._subs_dirty = False
+
+    def subscriber(self, callback: Optional[Callable[[], None]]=None, types: Optional[Iterable[Any]]=None) -> Any:
         """Decorator function to subscribe a function to *store changes*.
 
         The subscribed function will be called every time the internal state of
-        the store changes.
+        the store changes. The decorator can be used bare
+        (``@store.subscriber``) or parameterized with the same ``types``
+        filter accepted by :any:`revived.store.Store.subscribe`
+        (``@store.subscriber(types=(..,))``).
 
         **NOTE: The decorator function will return the function itself**. To
         unsubscribe the callback the user should use the
@@ -213,9 +380,15 @@ class Store:
 
         :param callback: The callback to be subscribed. :returns: The callback
             itself.
-        :returns: The wrapping subscriber.
+        :param types: An optional iterable of action types the callback is
+            interested in. When omitted the callback is called on every
+            state change.
+        :returns: The wrapping subscriber, or - when used parameterized -
+            the decorator producing it.
         """
-        unsubscribe = self.subscribe(callback)
+        if callback is None:
+            return partial(self.subscriber, types=types)
+        unsubscribe = self.subscribe(callback, types)
         s = Subscriber(callback, unsubscribe)
         return s
 
@@ -223,8 +396,11 @@ class Store:
         """Dispatches an ``action``.
 
         This is the only piece of code responsible of *dispatching actions*.
-        When an ``action`` is dispatched, the state is changed according to the
-        defined root reducer and all the subscribers are called.
+        When an ``action`` is dispatched, the state is changed according to
+        the defined root reducer and all the subscribers are called - but
+        only if the root reducer returned a different state object: a
+        dispatch whose reducers all return their input unchanged notifies
+        nobody.
 
         **The calling order is not guaranteed**.
 
@@ -233,12 +409,139 @@ class Store:
         """
         if self._is_reducing:
             raise DispatchInReducerError
+        handled = self._handled
+        if handled is not None and action._type_id not in handled:
+            # No reducer handles this action type: the state cannot change,
+            # and unchanged state means no notification, so the whole
+            # dispatch is a no-op past this check.
+            return
         self._is_reducing = True
-        self._state = self._reducer(self.get_state(), action)
-        self._is_reducing = False
-        subscribers = copy.copy(self._subscribers)
-        for cback in subscribers.values():
-            cback()
+        try:
+            # Read the state slot directly instead of going through
+            # get_state(): one python-level call less per dispatch.
+            prev = self._state
+            self._state = new = self._reducer(prev, action)
+        finally:
+            # Always clear the flag: a raising reducer must not leave the
+            # store permanently rejecting dispatches. try/finally costs
+            # nothing on the success path in CPython.
+            self._is_reducing = False
+        if new is prev:
+            # Reducers follow the redux convention of returning the previous
+            # state object untouched when nothing changed: subscribers are
+            # only notified on actual changes, so a no-op dispatch costs a
+            # reducer call and an identity check, with no subscriber
+            # traffic.
+            return
+        if self._batch_depth:
+            self._dirty = True
+            self._batch_types.add(action._type_id)
+            return
+        # Common fast path for stores without subscribers (e.g. the INIT
+        # dispatch performed during construction): a truthiness check on the
+        # shared empty tuple, no iterator setup.
+        if self._subs_dirty:
+            self._rebuild_snapshots()
+        subs = self._subs_snapshot
+        by_type = self._subs_by_type
+        if by_type:
+            extra = by_type.get(action._type_id)
+            if extra:
+                subs = subs + extra
+        if subs:
+            self._notify(subs)
+
+    def _notify(self, subs: tuple) -> None:
+        """Calls the given subscribers, isolating their exceptions.
+
+        A raising subscriber does not prevent the remaining ones from being
+        notified: exceptions are routed to the ``on_error`` handler when one
+        was given to the store, otherwise the first one is re-raised once
+        the loop has completed.
+
+        :param subs: The snapshot of subscriber callbacks to call.
+        """
+        on_error = self._on_error
+        first_error = None  # type: Optional[Exception]
+        for cback in subs:
+            try:
+                cback()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e, cback)
+                elif first_error is None:
+                    first_error = e
+        if first_error is not None:
+            raise first_error
+
+    def dispatch_many(self, actions: Iterable[Action]) -> None:
+        """Dispatches the given ``actions`` in order, notifying once.
+
+        Equivalent to dispatching each action inside
+        :any:`revived.store.Store.batch`: the state is reduced through the
+        whole sequence and subscribers are called a single time at the end -
+        and only if at least one action actually changed the state.
+        Subscribers never observe the intermediate states; that is the point
+        of the API when a frame emits many actions at once.
+
+        :param actions: The actions to be dispatched, in order.
+        :raises: :class:`revived.store.DispatchInReducerError`
+        """
+        def run() -> None:
+            # Hoist the bound method: one attribute lookup for the whole
+            # batch instead of one per action.
+            dispatch = self.dispatch
+            for a in actions:
+                dispatch(a)
+        self.batch(run)
+
+    def batch(self, fn: Callable[[], None]) -> None:
+        """Runs the given function, coalescing subscriber notifications.
+
+        Every :any:`revived.store.Store.dispatch` performed while the
+        function runs updates the state as usual but skips the subscriber
+        notification; subscribers are called exactly once at the end of the
+        batch - and only if at least one action was dispatched. Batches can
+        be nested: subscribers are notified when the outermost one ends.
+
+        When the batched function raises, the exception propagates, but the
+        state changes dispatched before the raise are real: subscribers are
+        still notified once for them, and the batch bookkeeping is reset so
+        later batches start clean.
+
+        :param fn: The function to be run inside the batch.
+        """
+        self._batch_depth += 1
+        try:
+            fn()
+        finally:
+            # The notification runs in the finally block: a raising batched
+            # function must not leave the dirty flag and the batched types
+            # behind, or the next - possibly empty - batch would spuriously
+            # notify for them.
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                if self._subs_dirty:
+                    self._rebuild_snapshots()
+                subs = self._subs_snapshot
+                by_type = self._subs_by_type
+                if by_type and self._batch_types:
+                    # A callback registered for several of the batched types
+                    # must still be called once: collect the interested ones
+                    # skipping duplicates. Type-filtered subscriber lists are
+                    # short, so the linear membership test beats building a
+                    # set.
+                    extra = []  # type: list
+                    for t in self._batch_types:
+                        for cback in by_type.get(t, ()):
+                            if cback not in extra:
+                                extra.append(cback)
+                    if extra:
+                        subs = subs + tuple(extra)
+                self._batch_types.clear()
+                if subs:
+                    self._notify(subs)
 
     def get_state(self) -> Any:
         """Getter for the global state.
@@ -6,6 +6,20 @@ here = path.abspath(path.dirname(__file__))
 
 VERSION = '0.1.4'
 
+# Optionally compile the dispatch hot path (action, reducer and store
+# modules) with Cython when it is available. The modules are plain python and
+# stay fully functional without compilation, so Cython is *not* a hard
+# dependency: source installs without Cython simply use the interpreted
+# modules.
+try:
+    from Cython.Build import cythonize
+    EXT_MODULES = cythonize(
+        ['revived/action.py', 'revived/reducer.py', 'revived/store.py'],
+        language_level=3,
+    )
+except ImportError:
+    EXT_MODULES = []
+
 with open(path.join(here, 'README.rst'), encoding='utf-8') as f:
     LONG_DESCRIPTION = f.read()
 
@@ -41,6 +55,8 @@ setup(
 
     packages=find_packages(exclude=['tests']),
 
+    ext_modules=EXT_MODULES,
+
     install_requires=[],
 
     extras_require={
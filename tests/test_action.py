@@ -1,6 +1,27 @@
 """Action tests.
 """
 from revived.action import action
+from revived.action import ActionType
+from revived.store import ActionType as StoreActionType
+
+
+def test_action__action_type_values_are_unique():
+    # Uniqueness of the member values is not verified at class-creation time
+    # anymore (see the ActionType docstring): assert it here instead for the
+    # action types the package itself defines.
+    values = [member.value for member in StoreActionType]
+    assert len(values) == len(set(values))
+
+
+def test_action__action_type_allows_aliases():
+    # Without the enum.unique() class-creation check, a duplicated value is
+    # a plain enum alias instead of a ValueError at import time.
+    class AT(ActionType):
+        ACTION = 'action'
+        ALIAS = 'action'
+
+    assert AT.ALIAS is AT.ACTION
+    assert [member.name for member in AT] == ['ACTION']
 
 
 def test_action__action_creator_without_arguments():
@@ -25,3 +46,14 @@ def test_action__action_creator_with_arguments():
     a = action2('second')
     assert a.type == 'action2'
     assert dict(a) == {'test': 'second'}
+
+
+def test_action__action_creator_with_fields():
+    @action('action3', fields=('test',))
+    def action3(value):
+        return {'test': value}
+
+    a = action3('value')
+    assert a.type == 'action3'
+    assert a.test == 'value'
+    assert dict(a) == {'test': 'value'}
@@ -1,6 +1,7 @@
 """Reducer tests.
 """
 from revived.action import Action
+from revived.action import ActionType
 from revived.reducer import combine_reducers
 from revived.reducer import Module
 from revived.reducer import reducer
@@ -18,6 +19,84 @@ def test_reducer__create():
     assert result is False
 
 
+def test_reducer__create_mixed_enum_and_string_types():
+    class AT(ActionType):
+        ACTION1 = 'action1'
+
+    # Enum members and plain strings sharing a value are interchangeable,
+    # matching the str mixin equality: AT.ACTION1 == 'action1'.
+    @reducer('action1')
+    def red(prev, action):
+        return not prev
+
+    assert red(False, Action(AT.ACTION1)) is True
+
+    @reducer(AT.ACTION1)
+    def red2(prev, action):
+        return not prev
+
+    assert red2(False, Action('action1')) is True
+
+
+def test_reducer__create_multiple_types():
+    @reducer('action1', 'action2')
+    def red(prev, action):
+        return not prev
+
+    result = red(False, Action('action1'))
+    assert result is True
+
+    result = red(False, Action('action2'))
+    assert result is True
+
+    result = red(False, Action('action3'))
+    assert result is False
+
+
+def test_reducer__module_reducer_direct_call():
+    module = Module()
+
+    @module.reducer('action1')
+    def red(prev, action):
+        return not prev
+
+    # The decorated function is gated exactly like the standalone
+    # decorator's result, even though the module's dispatch table holds the
+    # raw function.
+    assert red(False, Action('action1')) is True
+    assert red(False, Action('action2')) is False
+
+
+def test_reducer__module_reducer_multiple_types():
+    module = Module()
+
+    @module.reducer('action1', 'action2')
+    def red(prev, action):
+        return not prev
+
+    result = module(False, Action('action1'))
+    assert result is True
+    result = module(False, Action('action2'))
+    assert result is True
+    result = module(False, Action('action3'))
+    assert result is False
+
+
+def test_reducer__create_jit():
+    # Jitted reducers use the state-only calling convention; with numba
+    # missing the plain python function goes through the same convention,
+    # so the behavior is identical either way.
+    @reducer('action1', jit=True)
+    def red(prev):
+        return not prev
+
+    result = red(False, Action('action1'))
+    assert result is True
+
+    result = red(False, Action('action2'))
+    assert result is False
+
+
 def test_reducer__combine():
     @reducer('action1')
     def red1(prev, action):
@@ -37,6 +116,27 @@ def test_reducer__combine():
     assert result == {'part1': False, 'part2': False}
 
 
+def test_reducer__combine_structural_sharing():
+    @reducer('action1')
+    def red1(prev, action):
+        return not prev
+
+    combined = combine_reducers(part1=red1)
+
+    state = {'part1': False}
+
+    # Nothing handled the action: the very same state object comes back.
+    result = combined(state, Action('action2'))
+    assert result is state
+
+    # A subtree changed: a new enclosing dict is built, the old one is left
+    # untouched.
+    result = combined(state, Action('action1'))
+    assert result is not state
+    assert state == {'part1': False}
+    assert result == {'part1': True}
+
+
 def test_reducer__module_reducer():
     module = Module()
 
@@ -1,6 +1,8 @@
 """Store tests.
 """
 from revived.action import Action
+from revived.action import ActionType
+from revived.reducer import Module
 from revived.store import ActionType as AT
 from revived.store import DispatchInReducerError
 from revived.store import Store
@@ -35,6 +37,22 @@ def test_store__dispatch__dispatch_in_reducer(dummy_reducer):
         store.dispatch(Action('test'))
 
 
+def test_store__dispatch__reducer_exception(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    def failing_reducer(state, action):
+        raise RuntimeError
+
+    store._reducer = failing_reducer
+    with pytest.raises(RuntimeError):
+        store.dispatch(Action('test'))
+
+    # The store is still usable after a raising reducer.
+    store._reducer = dummy_reducer
+    store.dispatch(Action('test'))
+    assert store.get_state() == 'test'
+
+
 def test_store__dispatch__dispatch_in_subscriber(dummy_reducer):
     store = Store(dummy_reducer)
 
@@ -92,6 +110,235 @@ def test_store__dispatch__subscriber_decorator__direct_call(dummy_reducer):
     assert called
 
 
+def test_store__dispatch__init_in_custom_action_type_enum():
+    # Declaring 'init' in one's own enum must keep matching the store's
+    # shared INIT action: the initial state is built from it.
+    class MyAT(ActionType):
+        INIT = 'init'
+
+    module = Module()
+
+    @module.reducer(MyAT.INIT)
+    def init_state(prev, action):
+        return {'ready': True}
+
+    store = Store(module)
+    assert store.get_state() == {'ready': True}
+
+
+def test_store__empty_module_reducer_registered_later():
+    # A module with no reducers yet exposes an empty handled set: the store
+    # must treat it as unknown and keep invoking the module, so reducers
+    # registered afterwards are still reachable.
+    module = Module()
+    store = Store(module)
+
+    @module.reducer('known')
+    def known(prev, action):
+        return 'known'
+
+    store.dispatch(Action('known'))
+    assert store.get_state() == 'known'
+
+
+def test_store__dispatch__unhandled_action_type():
+    module = Module()
+
+    @module.reducer('known')
+    def known(prev, action):
+        return 'known'
+
+    store = Store(module)
+
+    called = False
+
+    def callback():
+        nonlocal called
+        called = True
+
+    store.subscribe(callback)
+
+    # The reducer tree is skipped entirely and, since the state cannot have
+    # changed, subscribers are not notified either.
+    store.dispatch(Action('unknown'))
+    assert store.get_state() is None
+    assert not called
+
+    store.dispatch(Action('known'))
+    assert store.get_state() == 'known'
+    assert called
+
+
+def test_store__dispatch__subscriber_exception(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    called = False
+
+    def failing():
+        raise RuntimeError
+
+    def callback():
+        nonlocal called
+        called = True
+
+    store.subscribe(failing)
+    store.subscribe(callback)
+
+    # The exception is re-raised, but only after every subscriber ran.
+    with pytest.raises(RuntimeError):
+        store.dispatch(Action('test'))
+    assert called
+
+
+def test_store__dispatch__subscriber_exception_handler(dummy_reducer):
+    errors = []
+
+    def on_error(error, callback):
+        errors.append(error)
+
+    def failing():
+        raise RuntimeError
+
+    store = Store(dummy_reducer, on_error=on_error)
+    store.subscribe(failing)
+
+    store.dispatch(Action('test'))
+    assert len(errors) == 1
+
+
+def test_store__batch(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    store.subscribe(callback)
+
+    def dispatch_many():
+        store.dispatch(Action('test1'))
+        store.dispatch(Action('test2'))
+
+    store.batch(dispatch_many)
+    assert store.get_state() == 'test2'
+    assert called == 1
+
+
+def test_store__batch__exception(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    store.subscribe(callback)
+
+    def dispatch_and_raise():
+        store.dispatch(Action('test1'))
+        raise RuntimeError
+
+    # The exception propagates, but the state change dispatched before the
+    # raise is real and still notified once.
+    with pytest.raises(RuntimeError):
+        store.batch(dispatch_and_raise)
+    assert store.get_state() == 'test1'
+    assert called == 1
+
+    # The batch bookkeeping was reset: an empty batch afterwards does not
+    # spuriously notify.
+    store.batch(lambda: None)
+    assert called == 1
+
+
+def test_store__dispatch_many(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    store.subscribe(callback)
+    store.dispatch_many([Action('test1'), Action('test2')])
+    assert store.get_state() == 'test2'
+    assert called == 1
+
+
+def test_store__batch__without_dispatch(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+
+    store.subscribe(callback)
+    store.batch(lambda: None)
+    assert called == 0
+
+
+def test_store__subscribe__types(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    calls = []
+
+    store.subscribe(lambda: calls.append('any'))
+    store.subscribe(lambda: calls.append('t1'), types=('test1',))
+
+    # Type-filtered subscribers only run for the types they asked for; the
+    # unfiltered one runs on every state change.
+    store.dispatch(Action('test1'))
+    assert calls == ['any', 't1']
+
+    store.dispatch(Action('test2'))
+    assert calls == ['any', 't1', 'any']
+
+
+def test_store__subscribe__types_batch(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    calls = []
+
+    store.subscribe(lambda: calls.append('t1'), types=('test1', 'test2'))
+
+    def dispatch_many():
+        store.dispatch(Action('test1'))
+        store.dispatch(Action('test2'))
+
+    # Both batched actions interest the subscriber: it still runs only once.
+    store.batch(dispatch_many)
+    assert calls == ['t1']
+
+    store.batch(lambda: store.dispatch(Action('test3')))
+    assert calls == ['t1']
+
+
+def test_store__subscriber_decorator__types(dummy_reducer):
+    store = Store(dummy_reducer)
+
+    calls = []
+
+    @store.subscriber(types=('test1',))
+    def callback():
+        calls.append('t1')
+
+    store.dispatch(Action('test1'))
+    assert calls == ['t1']
+
+    store.dispatch(Action('test2'))
+    assert calls == ['t1']
+
+    callback.unsubscribe()
+    store.dispatch(Action('test1'))
+    assert calls == ['t1']
+
+
 def test_store__unsubscribe(dummy_reducer):
     called = 0
 